@@ -1,54 +1,274 @@
 import argparse
+import bisect
+import functools
 import json
 import math
+import os
+import re
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from rich.console import Console
-from rich.table import Table
-from rich.text import Text
-from rich.panel import Panel
-from matplotlib import font_manager
+import numpy as np
 
+# rich and matplotlib are imported lazily inside the functions that need
+# them — matplotlib.font_manager builds its own font cache on import,
+# which makes even `--help` take hundreds of milliseconds otherwise.
 
-console = Console()
+_console = None
 
 
-# Auto-install dependencies if missing
-required = ["rich", "matplotlib"]
-import importlib.util
-for pkg in required:
-    if importlib.util.find_spec(pkg) is None:
-        print(f"Installing missing dependency: {pkg}")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", pkg])
+def _get_console():
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
+# Persistent font metadata cache — parsing every TTF/OTF header with
+# FontProperties on each run dominates startup time, so remember what we
+# learned about each file and only re-parse when its mtime/size changes.
+CACHE_FILE = Path.home() / ".cache" / "fuzzyfont" / "fonts.json"
+CACHE_VERSION = 1
+
+
+def _load_font_cache():
+    """Load the on-disk cache, or return an empty one if missing/stale."""
+    import matplotlib
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        # matplotlib's parser may change between releases — don't trust
+        # names extracted by a different version
+        if data.get("matplotlib") != matplotlib.__version__:
+            return {}
+        return data.get("fonts", {})
+    except Exception:
+        return {}
+
+
+def _save_font_cache(fonts_by_path):
+    import matplotlib
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_FILE, "w", encoding="utf-8") as fh:
+            json.dump({
+                "version": CACHE_VERSION,
+                "matplotlib": matplotlib.__version__,
+                "fonts": fonts_by_path,
+            }, fh)
+    except Exception:
+        pass  # cache is best-effort, never fail the run over it
+
+
+# Category bit encoding — six categories, one bit each, so the whole
+# classification of a font fits in a uint8 and filtering is a bitwise AND.
+CAT_BITS = {"mono": 1, "serif": 2, "sans": 4, "display": 8, "symbol": 16, "other": 32}
+
+
+def _cats_to_bits(cats):
+    bits = 0
+    for c in cats:
+        bits |= CAT_BITS[c]
+    return bits
+
+
+@functools.lru_cache(maxsize=None)  # only 2**6 distinct masks, the pool stays tiny
+def _bits_to_cats(bits):
+    """
+    Decode a bitmask back to a sorted tuple of category names. Cached so
+    every font with the same mask shares one immutable tuple instead of
+    display/export allocating a fresh list per font.
+    """
+    return tuple(sorted(c for c, b in CAT_BITS.items() if int(bits) & b))
+
+
+class FontSet:
+    """
+    Columnar store for the font list: three parallel arrays (names, paths,
+    category bitmasks) instead of one dict per font. Much smaller in
+    memory, and filtering/search become NumPy boolean masks.
+    """
+
+    def __init__(self, names, paths, cats, names_lower=None):
+        self.names = np.asarray(names, dtype=object)
+        self.paths = np.asarray(paths, dtype=object)
+        self.cats = np.asarray(cats, dtype=np.uint8)
+        if names_lower is None:
+            # fixed-width string array so np.char can scan it in C
+            names_lower = np.array([n.lower() for n in self.names], dtype=np.str_)
+        self.names_lower = names_lower
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, key):
+        # slices, boolean masks and index arrays all return a new FontSet
+        return FontSet(self.names[key], self.paths[key], self.cats[key],
+                       self.names_lower[key])
+
+    def search_mask(self, term):
+        """Boolean mask of fonts whose name contains term (case-insensitive)."""
+        return np.char.find(self.names_lower, term.lower()) >= 0
+
+    def prefix_mask(self, term):
+        """
+        Boolean mask of fonts whose name starts with term. Since
+        names_lower is sorted (and masks/slices preserve order), the
+        matching fonts form one contiguous run found by bisection —
+        O(log n) regardless of how many fonts are installed.
+        """
+        term = term.lower()
+        lo = bisect.bisect_left(self.names_lower, term)
+        hi = bisect.bisect_left(self.names_lower, term + chr(0x10FFFF), lo=lo)
+        mask = np.zeros(len(self), dtype=bool)
+        mask[lo:hi] = True
+        return mask
+
+    def rows(self):
+        """Yield (name, cats_bits, path) per font, in order."""
+        return zip(self.names, self.cats, self.paths)
+
+
+def _probe_font(args):
+    """Stat + identify one font file (runs in a worker thread).
+
+    Returns (path, name, cat_bits, resolved_path, new_cache_entry) where
+    new_cache_entry is None on a cache hit, or None entirely if the file
+    can't even be stat'ed.
+    """
+    from matplotlib import font_manager
+
+    f, entry, st = args
+    if st is None:
+        try:
+            st = os.stat(f)
+        except OSError:
+            return None
+
+    if entry and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+        # stat signature unchanged — reuse name + categories without
+        # touching the file contents
+        name = entry["name"]
+        cat_bits = _cats_to_bits(entry["cats"]) if entry.get("cats") else 0
+        new_entry = None
+    else:
+        try:
+            name = font_manager.FontProperties(fname=f).get_name()
+        except Exception:
+            # unreadable font — remember that too so we don't retry it
+            name = None
+        cat_bits = classify_font(name) if name else 0
+        new_entry = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "name": name,
+            "cats": _bits_to_cats(cat_bits),  # stored by name, bit values may change
+        }
+
+    # resolve in the worker so the realpath syscalls parallelize too
+    resolved = str(Path(f).resolve()) if name else None
+    return f, name, cat_bits, resolved, new_entry
+
+
+def _system_font_dirs():
+    """Top-level font directories for this platform (from matplotlib's own lists)."""
+    from matplotlib import font_manager
+    if sys.platform == "win32":
+        try:
+            return [font_manager.win32FontDirectory()]
+        except Exception:
+            return []
+    if sys.platform == "darwin":
+        return list(font_manager.OSXFontDirectories)
+    return list(font_manager.X11FontDirectories)
+
+
+def _walk_font_dirs(dirs):
+    """
+    Iterative os.scandir walk yielding (path, stat_result) for every
+    .ttf/.otf/.ttc file. Tighter than matplotlib's generic walk, and the
+    stat results double as the cache signature so _probe_font doesn't
+    have to stat again.
+    """
+    stack = list(dirs)
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith((".ttf", ".otf", ".ttc")):
+                        yield entry.path, entry.stat()
+                except OSError:
+                    continue
 
 
 # Fonts discovery & helpers
-def get_all_fonts():
-    """Return all system fonts as list of dicts: {'name','path'}."""
-    fonts = set()
-    for ext in ("ttf", "otf"):
-        fonts.update(font_manager.findSystemFonts(fontext=ext))
+def get_all_fonts(fast_discovery=False, want_bits=None):
+    """Return all system fonts as a FontSet sorted by name.
+
+    want_bits optionally narrows the result while it's being built: fonts
+    whose categories don't intersect the mask are dropped straight out of
+    the probe stream, before any dedup/sort/array work is spent on them.
+    """
+    from matplotlib import font_manager
+
+    if fast_discovery:
+        stats = dict(_walk_font_dirs(_system_font_dirs()))
+        fonts = set(stats)
+    else:
+        # one walk is enough: matplotlib treats "otf" as a synonym of the
+        # default "ttf" fontext, so both extensions come back from one call
+        stats = {}
+        fonts = set(font_manager.findSystemFonts())
+
+    cache = _load_font_cache()
+    cache_dirty = False
 
     out = []
     seen = set()
 
-    for f in fonts:
-        try:
-            prop = font_manager.FontProperties(fname=f)
-            name = prop.get_name()
+    # Each probe independently opens and parses one file — I/O dominated,
+    # so a thread pool gets near-linear wall-clock speedup. Dedupe happens
+    # back on the main thread to avoid any locking in the workers.
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for res in ex.map(_probe_font, ((f, cache.get(f), stats.get(f)) for f in fonts)):
+            if res is None:
+                continue
+            f, name, cat_bits, resolved, new_entry = res
+            if new_entry is not None:
+                cache[f] = new_entry
+                cache_dirty = True
             if not name:
                 continue
-            key = (name.lower(), Path(f).resolve())
-            if key in seen:
+            # narrow filter requested — drop non-matching fonts right here
+            # (cat_bits == 0 means unclassified, keep those for attach_classification)
+            if want_bits and cat_bits and not (cat_bits & want_bits):
                 continue
-            seen.add(key)
-            out.append({"name": name, "path": str(Path(f).resolve())})
-        except Exception:
-            # skip unreadable fonts
-            continue
-    return sorted(out, key=lambda x: x["name"].lower())
+            # the resolved path is already a unique identifier on its own
+            if resolved in seen:
+                continue
+            seen.add(resolved)
+            # lowercase once — the same string is reused for sorting and
+            # the FontSet search column
+            name_lower = name.lower()
+            out.append((name, resolved, cat_bits, name_lower))
+
+    if cache_dirty:
+        _save_font_cache(cache)
+    out.sort(key=lambda r: r[3])
+    return FontSet([r[0] for r in out], [r[1] for r in out], [r[2] for r in out],
+                   names_lower=np.array([r[3] for r in out], dtype=np.str_))
 
 # Predefined overrides for common fonts
 FONT_CATEGORY_OVERRIDES = {
@@ -76,22 +296,104 @@ FONT_CATEGORY_OVERRIDES = {
     "emoji one": "symbol",
 }
 
+# Heuristic keyword lists (tier 1); the overrides above are tier 0.
+HEURISTIC_KEYWORDS = {
+    "mono": ["mono", "code", "console", "fixed", "menlo", "monaco"],
+    "serif": ["serif", "times", "georgia", "cambria", "palatino"],
+    "sans": ["sans", "arial", "helvetica", "segoe", "noto sans", "open sans", "roboto"],
+    "display": ["display", "poster", "impact", "headline", "stencil", "black", "grotesk"],
+    "symbol": ["symbol", "wingdings", "dingbat", "emoji", "webdings"],
+}
+
+
+# All heuristic keywords fused into one regex, one named group per
+# category — the engine scans a name in a single pass instead of five
+# separate keyword-list sweeps. Names are lowercased before matching.
+_HEURISTIC_RE = re.compile(
+    "|".join(f"(?P<{cat}>{'|'.join(map(re.escape, words))})"
+             for cat, words in HEURISTIC_KEYWORDS.items())
+)
+
+
+def _build_automaton():
+    """
+    Compile every override key + heuristic keyword into one Aho-Corasick
+    automaton so classify_font scans each name once instead of running
+    ~30 separate substring checks. Entries are tagged (tier, priority,
+    category) so override matches still beat heuristic ones. Returns None
+    if pyahocorasick isn't installed.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+    auto = ahocorasick.Automaton()
+    for prio, (key, cat) in enumerate(FONT_CATEGORY_OVERRIDES.items()):
+        auto.add_word(key, (0, prio, cat))
+    for cat, words in HEURISTIC_KEYWORDS.items():
+        for w in words:
+            if not auto.exists(w):  # overrides win on identical keywords
+                auto.add_word(w, (1, 0, cat))
+    auto.make_automaton()
+    return auto
+
+
+_AUTOMATON = _build_automaton()
+
+
+@functools.lru_cache(maxsize=None)
+def _classify_name(name):
+    """
+    Name-only classification, memoized on the lowercase name — font
+    families ship many variants sharing a stem, so most lookups repeat.
+    Returns (override_bits, heuristic_bits) as CAT_BITS masks.
+    """
+    overrides = 0
+    heuristic = None
+
+    # 1. Check override mapping (the automaton collects heuristic hits in
+    #    the same single pass; they only apply when no override matched)
+    if _AUTOMATON is not None:
+        heuristic = 0
+        best = None
+        for _, (tier, prio, cat) in _AUTOMATON.iter(name):
+            if tier == 0:
+                if best is None or prio < best[0]:
+                    best = (prio, cat)
+            else:
+                heuristic |= CAT_BITS[cat]
+        if best is not None:
+            overrides = CAT_BITS[best[1]]
+    else:
+        for key, cat in FONT_CATEGORY_OVERRIDES.items():
+            if key in name:
+                overrides = CAT_BITS[cat]
+                break  # stop at first match
+
+    # 3. Heuristic parsing of name (fallback)
+    if heuristic is None:
+        heuristic = 0
+        if not overrides:
+            for m in _HEURISTIC_RE.finditer(name):
+                heuristic |= CAT_BITS[m.lastgroup]
+
+    return overrides, heuristic
+
+
 # Robust classification
 def classify_font(font_name, font_path=None):
     """
-    Classify a font into categories: mono, serif, sans, display, symbol, other using override mapping, font family metadata and heuristic
+    Classify a font into categories (mono, serif, sans, display, symbol,
+    other) using override mapping, font family metadata and heuristic.
+    Returns a CAT_BITS bitmask.
     """
     name = font_name.lower()
-    cats = set()
-
-    # 1. Check override mapping
-    for key, cat in FONT_CATEGORY_OVERRIDES.items():
-        if key in name:
-            cats.add(cat)
-            break  # stop at first match
+    overrides, heuristic = _classify_name(name)
+    if overrides:
+        return overrides
 
     # 2. Use FontProperties if path is provided
-    if font_path and not cats:
+    if font_path:
         try:
             from matplotlib import font_manager
             prop = font_manager.FontProperties(fname=font_path)
@@ -99,67 +401,56 @@ def classify_font(font_name, font_path=None):
             if family:
                 family_name = family[0].lower()
                 if any(x in family_name for x in ["mono", "courier", "code", "console", "fixed", "menlo", "monaco"]):
-                    cats.add("mono")
+                    return CAT_BITS["mono"]
                 elif any(x in family_name for x in ["serif", "times", "georgia", "cambria", "palatino"]):
-                    cats.add("serif")
+                    return CAT_BITS["serif"]
                 elif any(x in family_name for x in ["sans", "arial", "helvetica", "segoe", "noto sans", "open sans", "roboto"]):
-                    cats.add("sans")
+                    return CAT_BITS["sans"]
         except Exception:
             pass  # fallback to heuristic
 
-    # 3. Heuristic parsing of name (fallback)
-    if not cats:
-        if any(x in name for x in ["mono", "code", "console", "fixed", "menlo", "monaco"]):
-            cats.add("mono")
-        if any(x in name for x in ["serif", "times", "georgia", "cambria", "palatino"]):
-            cats.add("serif")
-        if any(x in name for x in ["sans", "arial", "helvetica", "segoe", "noto sans", "open sans", "roboto"]):
-            cats.add("sans")
-        if any(x in name for x in ["display", "poster", "impact", "headline", "stencil", "black", "grotesk"]):
-            cats.add("display")
-        if any(x in name for x in ["symbol", "wingdings", "dingbat", "emoji", "webdings"]):
-            cats.add("symbol")
-
     # 4. Fallback if still nothing matched
-    if not cats:
-        cats.add("other")
-    return cats
+    return heuristic or CAT_BITS["other"]
 
 
 def attach_classification(fonts):
-    """Return new list with 'cats' key (set of categories)."""
-    for f in fonts:
-        f["cats"] = classify_font(f["name"])
+    """Fill in categories for any font that didn't come classified from the cache."""
+    for i in np.flatnonzero(fonts.cats == 0):
+        fonts.cats[i] = classify_font(fonts.names[i])
     return fonts
 
 
 # Filtering, searching
-def filter_fonts(fonts, mono=False, serif=False, sans=False, display=False, symbol=False):
-    # If no flag requested, return fonts unchanged
+def filter_fonts(fonts, mono=False, serif=False, sans=False, display=False, symbol=False, search=None):
+    """Apply category flags and an optional name search in one pass —
+    the masks are AND-ed together so rows are selected exactly once."""
     flags = {"mono": mono, "serif": serif, "sans": sans, "display": display, "symbol": symbol}
-    if not any(flags.values()):
-        return fonts
-    want = {k for k, v in flags.items() if v}
-    filtered = [f for f in fonts if f["cats"] & want]
-    return filtered
+    want = _cats_to_bits(k for k, v in flags.items() if v)
+    mask = None
+    if want:
+        mask = (fonts.cats & want) != 0
+    if search:
+        smask = fonts.search_mask(search)
+        mask = smask if mask is None else mask & smask
+    return fonts if mask is None else fonts[mask]
 
 
 # Stats
 def compute_stats(fonts):
     """Return dict: counts per category + total + top examples."""
-    counts = {"mono": 0, "serif": 0, "sans": 0, "display": 0, "symbol": 0, "other": 0}
-    examples = {k: [] for k in counts}
-    for f in fonts:
-        for c in f["cats"]:
-            if c in counts:
-                counts[c] += 1
-                if len(examples[c]) < 5:
-                    examples[c].append(f["name"])
-    total = len(fonts)
-    return {"total": total, "counts": counts, "examples": examples}
+    counts = {}
+    examples = {}
+    for cat, bit in CAT_BITS.items():
+        mask = (fonts.cats & bit) != 0
+        counts[cat] = int(mask.sum())
+        examples[cat] = list(fonts.names[mask][:5])
+    return {"total": len(fonts), "counts": counts, "examples": examples}
 
 
 def print_stats(stats):
+    from rich.table import Table
+
+    console = _get_console()
     table = Table(title="Font Statistics", show_lines=False)
     table.add_column("Category", style="cyan", no_wrap=True)
     table.add_column("Count", justify="right", style="green")
@@ -172,46 +463,74 @@ def print_stats(stats):
 
 
 # Display / export
+# Rows per table when streaming large listings to the terminal
+TABLE_CHUNK = 50
+
+
 def show_fonts_table(fonts, start=0, limit=None):
-    """Show fonts in a rich table (optionally paginate with start and limit)."""
+    """Show fonts in a rich table (optionally paginate with start and limit).
+
+    Long listings are rendered and printed TABLE_CHUNK rows at a time, so
+    the first rows paint immediately and we never materialize one giant
+    Table (Rich builds styled segments for every row before printing).
+    """
+    from rich.table import Table
+
+    console = _get_console()
     subset = fonts if limit is None else fonts[start:start + limit]
-    table = Table(title=f"Available Fonts ({len(fonts)}) — showing {len(subset)}", show_lines=False)
-    table.add_column("#", style="dim", width=6)
-    table.add_column("Font Name", style="cyan", overflow="fold")
-    table.add_column("Categories", style="yellow", no_wrap=False, overflow="fold")
-    table.add_column("File Path", style="dim", overflow="fold")
-
-    for i, f in enumerate(subset, start=start + 1):
-        cats = ", ".join(sorted(f["cats"]))
-        table.add_row(str(i), f["name"], cats, f["path"])
-    console.print(table)
+
+    for chunk_start in range(0, len(subset), TABLE_CHUNK) or [0]:
+        first = chunk_start == 0
+        table = Table(
+            title=f"Available Fonts ({len(fonts)}) — showing {len(subset)}" if first else None,
+            show_lines=False,
+            show_header=first,
+        )
+        table.add_column("#", style="dim", width=6)
+        table.add_column("Font Name", style="cyan", overflow="fold")
+        table.add_column("Categories", style="yellow", no_wrap=False, overflow="fold")
+        table.add_column("File Path", style="dim", overflow="fold")
+
+        chunk = subset[chunk_start:chunk_start + TABLE_CHUNK]
+        for i, (name, bits, path) in enumerate(chunk.rows(), start=start + chunk_start + 1):
+            table.add_row(str(i), name, ", ".join(_bits_to_cats(bits)), path)
+        console.print(table)
+
+
+def _export_records(fonts):
+    """Yield one exportable dict per font (bitmasks decoded to names)."""
+    for name, bits, path in fonts.rows():
+        yield {"name": name, "path": path, "categories": _bits_to_cats(bits)}
 
 
 def export_fonts(fonts, output_path):
     """Export font list to JSON or TXT file"""
+    console = _get_console()
     output_path = Path(output_path).expanduser().resolve()
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        # Convert sets to lists for JSON safety
-        exportable_fonts = []
-        for f in fonts:
-            exportable_fonts.append({
-                "name": f["name"],
-                "path": f["path"],
-                "categories": sorted(f.get("cats", []))
-            })
-
+        # Stream records one at a time through a 1 MiB binary buffer
+        # instead of materializing the whole list (and, for JSON, the
+        # whole encoded string) in memory first
         if output_path.suffix.lower() == ".json":
-            with open(output_path, "w", encoding="utf-8") as fh:
-                json.dump(exportable_fonts, fh, indent=2, ensure_ascii=False)
-            console.print(f"[bold green]Exported {len(fonts)} fonts to {output_path}[/bold green]")
+            with open(output_path, "wb", buffering=1 << 20) as fh:
+                fh.write(b"[\n")
+                for i, rec in enumerate(_export_records(fonts)):
+                    if i:
+                        fh.write(b",\n")
+                    fh.write(b"  ")
+                    fh.write(json.dumps(rec, ensure_ascii=False).encode("utf-8"))
+                fh.write(b"\n]")
         else:
-            with open(output_path, "w", encoding="utf-8") as fh:
-                for f in exportable_fonts:
-                    cats = ",".join(f["categories"])
-                    fh.write(f"{f['name']}\t{cats}\t{f['path']}\n")
-            console.print(f"[bold green]Exported {len(fonts)} fonts to {output_path}[/bold green]")
+            with open(output_path, "wb", buffering=1 << 20) as fh:
+                # writelines drains the generator straight into the 1 MiB
+                # buffer — no per-row write call, still O(1) memory
+                fh.writelines(
+                    f"{name}\t{','.join(_bits_to_cats(bits))}\t{path}\n".encode("utf-8")
+                    for name, bits, path in fonts.rows()
+                )
+        console.print(f"[bold green]Exported {len(fonts)} fonts to {output_path}[/bold green]")
 
     except Exception as e:
         console.print(f"[bold red]Failed to export fonts:[/bold red] {e}")
@@ -223,34 +542,50 @@ def run_tui(all_fonts):
     Commands:
       l         -> list (paged)
       n / p     -> next / previous page while listing
-      s <term>  -> search by name
+      s <term>  -> search by name prefix (*term* for substring)
       t         -> show stats
       f         -> toggle filter menu
       e <path>  -> export current list
       q         -> quit
       h         -> help
     """
-    fonts = all_fonts[:]  # current working set (after filters/search)
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = _get_console()
+    fonts = all_fonts  # current working set (after filters/search)
     applied_filters = {"mono": False, "serif": False, "sans": False, "display": False, "symbol": False}
     search_term = ""
     page = 0
     page_size = 16
+    # stats keyed by (active filters, search term) — the underlying font
+    # set never changes during a session, so repeated 't' commands in the
+    # same state shouldn't rescan anything
+    stats_cache = {}
 
     def refresh_working_set():
         nonlocal fonts
         # attach classification already present
-        filtered = filter_fonts(all_fonts, **applied_filters)
+        # build one combined mask so filters + search select rows once
+        want = _cats_to_bits(k for k, v in applied_filters.items() if v)
+        mask = None
+        if want:
+            mask = (all_fonts.cats & want) != 0
         if search_term:
-            term = search_term.lower()
-            filtered = [f for f in filtered if term in f["name"].lower()]
-        fonts = filtered
+            if "*" in search_term:
+                # wildcard query — fall back to the substring scan
+                smask = all_fonts.search_mask(search_term.replace("*", ""))
+            else:
+                smask = all_fonts.prefix_mask(search_term)
+            mask = smask if mask is None else mask & smask
+        fonts = all_fonts if mask is None else all_fonts[mask]
 
     def show_menu():
         panel = Panel.fit(
             "[b]Commands[/b]\n"
             " l            List fonts (paged)\n"
             " n / p        Next / previous page while listing\n"
-            " s <term>     Search fonts by name (empty to clear)\n"
+            " s <term>     Search fonts by name prefix (*term* for substring, empty to clear)\n"
             " f            Toggle filters (mono/serif/sans/display/symbol)\n"
             " t            Show statistics\n"
             " e <path>     Export current list to path (txt or .json)\n"
@@ -354,7 +689,10 @@ def run_tui(all_fonts):
             continue
 
         if cmd == "t":
-            st = compute_stats(fonts)
+            key = (tuple(sorted(k for k, v in applied_filters.items() if v)), search_term)
+            st = stats_cache.get(key)
+            if st is None:
+                st = stats_cache[key] = compute_stats(fonts)
             print_stats(st)
             continue
 
@@ -384,10 +722,18 @@ def main():
     parser.add_argument("--export", type=str, help="Export font list to file (txt or json)")
     parser.add_argument("--limit", type=int, help="Limit number of fonts shown", default=None)
     parser.add_argument("--stats", action="store_true", help="Show statistics (counts by category)")
+    parser.add_argument("--fast-discovery", action="store_true",
+                        help="Find fonts with a direct directory walk instead of matplotlib's discovery")
     parser.add_argument("--tui", action="store_true", help="Open interactive textual UI")
     args = parser.parse_args()
 
-    fonts = get_all_fonts()
+    # the TUI needs the full set; otherwise category flags can prune fonts
+    # during discovery instead of classifying everything first
+    want = 0
+    if not args.tui:
+        want = _cats_to_bits(k for k in ("mono", "serif", "sans", "display", "symbol")
+                             if getattr(args, k))
+    fonts = get_all_fonts(fast_discovery=args.fast_discovery, want_bits=want or None)
     fonts = attach_classification(fonts)
 
     if args.tui:
@@ -395,18 +741,15 @@ def main():
         run_tui(fonts)
         return
 
-    # non-TUI flow
-    fonts = filter_fonts(fonts, args.mono, args.serif, args.sans, args.display, args.symbol)
-
-    if args.search:
-        term = args.search.lower()
-        fonts = [f for f in fonts if term in f["name"].lower()]
+    # non-TUI flow — filters and search applied in a single pass
+    fonts = filter_fonts(fonts, args.mono, args.serif, args.sans, args.display,
+                         args.symbol, search=args.search)
 
     if args.limit:
         fonts = fonts[: args.limit]
 
     if not fonts:
-        console.print("[red]No fonts found matching your criteria.[/red]")
+        _get_console().print("[red]No fonts found matching your criteria.[/red]")
         sys.exit(0)
 
     show_fonts_table(fonts)
@@ -420,5 +763,12 @@ def main():
 
 
 if __name__ == "__main__":
+    # Auto-install dependencies if missing — only when run as a script,
+    # so importing fuzzy as a library never spawns pip
+    import importlib.util
+    for pkg in ("rich", "matplotlib"):
+        if importlib.util.find_spec(pkg) is None:
+            print(f"Installing missing dependency: {pkg}")
+            subprocess.check_call([sys.executable, "-m", "pip", "install", pkg])
     main()
 